@@ -232,77 +232,83 @@ export async function POST(
       }
     }
 
-    // Process each file
-    const uploadedAttachments: ConversationAttachment[] = [];
-
-    for (const file of files) {
-      try {
-        const documentId = crypto.randomUUID();
-        const extension = file.name.split('.').pop()?.toLowerCase() || 'pdf';
-        const storagePath = `${agencyId}/${documentId}.${extension}`;
-
-        // Upload to Supabase Storage
-        const fileBuffer = await file.arrayBuffer();
-        const { error: uploadError } = await supabase.storage
-          .from('documents')
-          .upload(storagePath, fileBuffer, {
-            contentType: file.type,
-            upsert: false,
+    // Process files concurrently - each upload is independent, so total
+    // latency is the slowest file rather than the sum of all files
+    const uploadResults = await Promise.all(
+      files.map(async (file): Promise<ConversationAttachment | null> => {
+        try {
+          const documentId = crypto.randomUUID();
+          const extension = file.name.split('.').pop()?.toLowerCase() || 'pdf';
+          const storagePath = `${agencyId}/${documentId}.${extension}`;
+
+          // Upload to Supabase Storage
+          const fileBuffer = await file.arrayBuffer();
+          const { error: uploadError } = await supabase.storage
+            .from('documents')
+            .upload(storagePath, fileBuffer, {
+              contentType: file.type,
+              upsert: false,
+            });
+
+          if (uploadError) {
+            log.error('Storage upload failed', uploadError);
+            throw new Error(`Failed to upload ${file.name}: ${uploadError.message}`);
+          }
+
+          // Create document record
+          await createDocumentRecord(supabase, {
+            id: documentId,
+            agencyId,
+            uploadedBy: user.id,
+            filename: file.name,
+            storagePath,
           });
 
-        if (uploadError) {
-          log.error('Storage upload failed', uploadError);
-          throw new Error(`Failed to upload ${file.name}: ${uploadError.message}`);
-        }
-
-        // Create document record
-        const document = await createDocumentRecord(supabase, {
-          id: documentId,
-          agencyId,
-          uploadedBy: user.id,
-          filename: file.name,
-          storagePath,
-        });
-
-        // Link document to conversation
-        const { error: linkError } = await supabase
-          .from('ai_buddy_conversation_documents')
-          .insert({
-            conversation_id: conversationId,
-            document_id: documentId,
+          // Link document to conversation
+          const { error: linkError } = await supabase
+            .from('ai_buddy_conversation_documents')
+            .insert({
+              conversation_id: conversationId,
+              document_id: documentId,
+            });
+
+          if (linkError) {
+            log.error('Failed to link document to conversation', linkError);
+            throw new Error(`Failed to link ${file.name} to conversation`);
+          }
+
+          // Create processing job (async processing via pg_cron)
+          await createProcessingJob(documentId);
+
+          log.info('Document attached to conversation', {
+            conversationId,
+            documentId,
+            filename: file.name,
+            userId: user.id,
           });
 
-        if (linkError) {
-          log.error('Failed to link document to conversation', linkError);
-          throw new Error(`Failed to link ${file.name} to conversation`);
+          return {
+            document_id: documentId,
+            attached_at: new Date().toISOString(),
+            document: {
+              id: documentId,
+              name: file.name,
+              file_type: extension,
+              status: 'processing',
+              page_count: null,
+            },
+          };
+        } catch (fileError) {
+          log.error('Failed to process file', fileError instanceof Error ? fileError : new Error(String(fileError)));
+          // Continue processing other files, but log the error
+          return null;
         }
+      })
+    );
 
-        // Create processing job (async processing via pg_cron)
-        await createProcessingJob(documentId);
-
-        uploadedAttachments.push({
-          document_id: documentId,
-          attached_at: new Date().toISOString(),
-          document: {
-            id: documentId,
-            name: file.name,
-            file_type: extension,
-            status: 'processing',
-            page_count: null,
-          },
-        });
-
-        log.info('Document attached to conversation', {
-          conversationId,
-          documentId,
-          filename: file.name,
-          userId: user.id,
-        });
-      } catch (fileError) {
-        log.error('Failed to process file', fileError instanceof Error ? fileError : new Error(String(fileError)));
-        // Continue processing other files, but log the error
-      }
-    }
+    const uploadedAttachments = uploadResults.filter(
+      (att): att is ConversationAttachment => att !== null
+    );
 
     if (uploadedAttachments.length === 0) {
       return createErrorResponse('INTERNAL_ERROR', 'Failed to upload any files', 500);
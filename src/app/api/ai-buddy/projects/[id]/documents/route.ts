@@ -413,78 +413,84 @@ async function handleFileUpload(
     }
   }
 
-  // Process each file
-  const uploadedDocuments: ProjectDocument[] = [];
-
-  for (const file of files) {
-    try {
-      const documentId = crypto.randomUUID();
-      const extension = file.name.split('.').pop()?.toLowerCase() || 'pdf';
-      const storagePath = `${agencyId}/${documentId}.${extension}`;
-
-      // Upload to Supabase Storage
-      const fileBuffer = await file.arrayBuffer();
-      const { error: uploadError } = await supabase.storage
-        .from('documents')
-        .upload(storagePath, fileBuffer, {
-          contentType: file.type,
-          upsert: false,
+  // Process files concurrently - each upload is independent, so total
+  // latency is the slowest file rather than the sum of all files
+  const uploadResults = await Promise.all(
+    files.map(async (file): Promise<ProjectDocument | null> => {
+      try {
+        const documentId = crypto.randomUUID();
+        const extension = file.name.split('.').pop()?.toLowerCase() || 'pdf';
+        const storagePath = `${agencyId}/${documentId}.${extension}`;
+
+        // Upload to Supabase Storage
+        const fileBuffer = await file.arrayBuffer();
+        const { error: uploadError } = await supabase.storage
+          .from('documents')
+          .upload(storagePath, fileBuffer, {
+            contentType: file.type,
+            upsert: false,
+          });
+
+        if (uploadError) {
+          log.error('Storage upload failed', uploadError);
+          throw new Error(`Failed to upload ${file.name}: ${uploadError.message}`);
+        }
+
+        // Create document record
+        await createDocumentRecord(supabase, {
+          id: documentId,
+          agencyId,
+          uploadedBy: userId,
+          filename: file.name,
+          storagePath,
         });
 
-      if (uploadError) {
-        log.error('Storage upload failed', uploadError);
-        throw new Error(`Failed to upload ${file.name}: ${uploadError.message}`);
-      }
-
-      // Create document record
-      await createDocumentRecord(supabase, {
-        id: documentId,
-        agencyId,
-        uploadedBy: userId,
-        filename: file.name,
-        storagePath,
-      });
-
-      // Link document to project
-      const { error: linkError } = await supabase
-        .from('ai_buddy_project_documents')
-        .insert({
-          project_id: projectId,
-          document_id: documentId,
+        // Link document to project
+        const { error: linkError } = await supabase
+          .from('ai_buddy_project_documents')
+          .insert({
+            project_id: projectId,
+            document_id: documentId,
+          });
+
+        if (linkError) {
+          log.error('Failed to link document to project', linkError);
+          throw new Error(`Failed to link ${file.name} to project`);
+        }
+
+        // Create processing job (async processing via pg_cron)
+        await createProcessingJob(documentId);
+
+        log.info('Document uploaded to project', {
+          projectId,
+          documentId,
+          filename: file.name,
+          userId,
         });
 
-      if (linkError) {
-        log.error('Failed to link document to project', linkError);
-        throw new Error(`Failed to link ${file.name} to project`);
+        return {
+          document_id: documentId,
+          attached_at: new Date().toISOString(),
+          document: {
+            id: documentId,
+            name: file.name,
+            file_type: extension,
+            status: 'processing',
+            page_count: null,
+            created_at: new Date().toISOString(),
+          },
+        };
+      } catch (fileError) {
+        log.error('Failed to process file', fileError instanceof Error ? fileError : new Error(String(fileError)));
+        // Continue processing other files
+        return null;
       }
+    })
+  );
 
-      // Create processing job (async processing via pg_cron)
-      await createProcessingJob(documentId);
-
-      uploadedDocuments.push({
-        document_id: documentId,
-        attached_at: new Date().toISOString(),
-        document: {
-          id: documentId,
-          name: file.name,
-          file_type: extension,
-          status: 'processing',
-          page_count: null,
-          created_at: new Date().toISOString(),
-        },
-      });
-
-      log.info('Document uploaded to project', {
-        projectId,
-        documentId,
-        filename: file.name,
-        userId,
-      });
-    } catch (fileError) {
-      log.error('Failed to process file', fileError instanceof Error ? fileError : new Error(String(fileError)));
-      // Continue processing other files
-    }
-  }
+  const uploadedDocuments = uploadResults.filter(
+    (doc): doc is ProjectDocument => doc !== null
+  );
 
   if (uploadedDocuments.length === 0) {
     return createErrorResponse('INTERNAL_ERROR', 'Failed to upload any files', 500);
@@ -57,6 +57,19 @@ export async function POST(request: NextRequest) {
 
     const agencyId = userData.agency_id;
 
+    // Reject clearly oversize requests before parsing the multipart body.
+    // Content-Length covers the file plus form overhead, so it can only
+    // over-estimate; the exact file.size check below still applies.
+    const contentLength = Number(request.headers.get('content-length'));
+    if (contentLength && contentLength > MAX_FILE_SIZE + 16 * 1024) {
+      const error: ApiError = {
+        code: 'FILE_TOO_LARGE',
+        message: `File too large. Maximum size is ${MAX_FILE_SIZE / (1024 * 1024)}MB`,
+        details: { contentLength, maxSize: MAX_FILE_SIZE },
+      };
+      return NextResponse.json({ data: null, error }, { status: 413 });
+    }
+
     // Parse form data
     const formData = await request.formData();
     const file = formData.get('file') as File | null;
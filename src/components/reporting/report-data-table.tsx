@@ -141,7 +141,9 @@ function formatCellValue(value: unknown): string {
   if (typeof value === 'string') {
     const trimmed = value.trim();
     // If it looks like a currency value without formatting, format it
-    if (/^\$?[\d,]+\.?\d*$/.test(trimmed)) {
+    // Well-formed amounts only (grouped thousands or plain digits) - avoids
+    // the backtracking-prone [\d,]+\.?\d* form on long non-currency strings
+    if (/^\$?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?$/.test(trimmed)) {
       const num = parseFloat(trimmed.replace(/[$,]/g, ''));
       if (!isNaN(num)) {
         return new Intl.NumberFormat('en-US', {
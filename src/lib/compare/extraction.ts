@@ -417,6 +417,22 @@ function buildExtractionContext(chunks: DocumentChunk[]): string {
 // GPT-5.1 Structured Output Extraction
 // ============================================================================
 
+// OpenAI client is created lazily on first use and reused for the life of
+// the process - per-call construction re-reads env and rebuilds transport
+// state, and a shared client keeps connections pooled across extractions
+let openaiClient: OpenAI | null = null;
+
+function getOpenAIClient(): OpenAI {
+  if (!openaiClient) {
+    const apiKey = process.env.OPENAI_API_KEY;
+    if (!apiKey) {
+      throw new Error('OPENAI_API_KEY environment variable is not set');
+    }
+    openaiClient = new OpenAI({ apiKey });
+  }
+  return openaiClient;
+}
+
 /**
  * Call GPT-5.1 with zodResponseFormat for structured extraction.
  * Uses OpenAI SDK's structured outputs for guaranteed schema compliance.
@@ -426,12 +442,7 @@ async function callGPTExtraction(
   context: string,
   documentId: string
 ): Promise<QuoteExtraction> {
-  const apiKey = process.env.OPENAI_API_KEY;
-  if (!apiKey) {
-    throw new Error('OPENAI_API_KEY environment variable is not set');
-  }
-
-  const openai = new OpenAI({ apiKey });
+  const openai = getOpenAIClient();
 
   let lastError: Error | null = null;
   let delay = INITIAL_RETRY_DELAY_MS;
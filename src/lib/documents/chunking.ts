@@ -27,6 +27,15 @@ const SEPARATORS = ['\n\n', '\n', '. ', ' '];
 // Pattern: Header row | separator row | data rows
 const TABLE_PATTERN = /(\|[^\n]+\|\n\|[-:| ]+\|\n(?:\|[^\n]+\|\n?)+)/g;
 
+// Table placeholder inserted by extractTablesWithPlaceholders()
+const TABLE_PLACEHOLDER_PATTERN = /\{\{TABLE_\d+\}\}/g;
+
+// Page marker pattern - matches "--- PAGE N ---" boundaries
+const PAGE_MARKER_PATTERN = /---\s*PAGE\s+(\d+)\s*---/gi;
+
+// Matches the page-number capture groups produced by PAGE_MARKER_PATTERN
+const PAGE_NUMBER_PATTERN = /^\d+$/;
+
 export interface ChunkOptions {
   targetTokens: number;
   overlapTokens: number;
@@ -272,10 +281,9 @@ function splitByPages(markdown: string, pageMarkers: PageMarker[]): PageContent[
   }
 
   const pages: PageContent[] = [];
-  const pagePattern = /---\s*PAGE\s+(\d+)\s*---/gi;
 
   // Split by page markers
-  const parts = markdown.split(pagePattern);
+  const parts = markdown.split(PAGE_MARKER_PATTERN);
 
   if (parts.length === 1) {
     // No page markers found, treat as single page
@@ -289,17 +297,19 @@ function splitByPages(markdown: string, pageMarkers: PageMarker[]): PageContent[
     const part = parts[i];
     if (part === undefined) continue;
 
+    // Trim once - each part is either a page-number capture or page content
+    const trimmed = part.trim();
+
     // Check if this part is a page number (digit only from regex capture)
-    if (/^\d+$/.test(part.trim())) {
-      currentPage = parseInt(part.trim(), 10);
+    if (PAGE_NUMBER_PATTERN.test(trimmed)) {
+      currentPage = parseInt(trimmed, 10);
       continue;
     }
 
-    const content = part.trim();
-    if (content) {
+    if (trimmed) {
       pages.push({
         pageNumber: currentPage,
-        content,
+        content: trimmed,
       });
     }
   }
@@ -329,7 +339,7 @@ function chunkPageWithTableAwareness(
 
   for (const chunk of textChunks) {
     // Check if chunk contains table placeholder
-    const placeholderMatches = chunk.match(/\{\{TABLE_\d+\}\}/g);
+    const placeholderMatches = chunk.match(TABLE_PLACEHOLDER_PATTERN);
 
     if (placeholderMatches && placeholderMatches.length > 0) {
       // Split chunk around table placeholders
@@ -82,6 +82,56 @@ export function getSuggestedAction(code: QuoteError['code']): string {
   }
 }
 
+/**
+ * Error classification patterns - first match wins.
+ * Mirrors the pattern-array classifier in the process-document Edge
+ * Function: each tier's trigger phrases are compiled once into a single
+ * case-insensitive alternation, so categorization is one regex test per
+ * tier instead of a chain of lowercased substring scans.
+ */
+const ERROR_CLASSIFICATION_PATTERNS: Array<{
+  code: QuoteError['code'];
+  pattern: RegExp;
+  message: string;
+  recoverable: boolean;
+}> = [
+  // Authentication errors
+  {
+    code: 'CREDENTIALS_INVALID',
+    pattern: /authentication|login failed|invalid credentials|password|unauthorized/i,
+    message: 'Login to carrier portal failed. Please check your credentials.',
+    recoverable: false,
+  },
+  // CAPTCHA errors ("captcha" also matches recaptcha/hcaptcha)
+  {
+    code: 'CAPTCHA_FAILED',
+    pattern: /captcha/i,
+    message: 'CAPTCHA verification was required but could not be completed.',
+    recoverable: false,
+  },
+  // Portal unavailable
+  {
+    code: 'PORTAL_UNAVAILABLE',
+    pattern: /unavailable|connection|network|503|502|site down/i,
+    message: 'Carrier portal is currently unavailable.',
+    recoverable: true,
+  },
+  // Form/navigation errors - FORM_CHANGED gets 1 retry at most
+  {
+    code: 'FORM_CHANGED',
+    pattern: /element not found|navigation failed|selector|form changed/i,
+    message: 'Carrier portal form has changed. Automation needs updating.',
+    recoverable: false,
+  },
+  // Timeout errors
+  {
+    code: 'TIMEOUT',
+    pattern: /timeout|timed out|deadline exceeded/i,
+    message: 'Request timed out while processing.',
+    recoverable: true,
+  },
+];
+
 /**
  * Map error string to QuoteError
  * Categorizes various error conditions from any agent adapter
@@ -90,87 +140,16 @@ export function mapErrorToQuoteError(
   error: string,
   carrierCode: string
 ): QuoteError {
-  const errorLower = error.toLowerCase();
-
-  // Authentication errors
-  if (
-    errorLower.includes('authentication') ||
-    errorLower.includes('login failed') ||
-    errorLower.includes('invalid credentials') ||
-    errorLower.includes('password') ||
-    errorLower.includes('unauthorized')
-  ) {
-    return {
-      code: 'CREDENTIALS_INVALID',
-      message: 'Login to carrier portal failed. Please check your credentials.',
-      carrierCode,
-      recoverable: false,
-      suggestedAction: getSuggestedAction('CREDENTIALS_INVALID'),
-    };
-  }
-
-  // CAPTCHA errors
-  if (
-    errorLower.includes('captcha') ||
-    errorLower.includes('recaptcha') ||
-    errorLower.includes('hcaptcha')
-  ) {
-    return {
-      code: 'CAPTCHA_FAILED',
-      message: 'CAPTCHA verification was required but could not be completed.',
-      carrierCode,
-      recoverable: false,
-      suggestedAction: getSuggestedAction('CAPTCHA_FAILED'),
-    };
-  }
-
-  // Portal unavailable
-  if (
-    errorLower.includes('unavailable') ||
-    errorLower.includes('connection') ||
-    errorLower.includes('network') ||
-    errorLower.includes('503') ||
-    errorLower.includes('502') ||
-    errorLower.includes('site down')
-  ) {
-    return {
-      code: 'PORTAL_UNAVAILABLE',
-      message: 'Carrier portal is currently unavailable.',
-      carrierCode,
-      recoverable: true,
-      suggestedAction: getSuggestedAction('PORTAL_UNAVAILABLE'),
-    };
-  }
-
-  // Form/navigation errors
-  if (
-    errorLower.includes('element not found') ||
-    errorLower.includes('navigation failed') ||
-    errorLower.includes('selector') ||
-    errorLower.includes('form changed')
-  ) {
-    return {
-      code: 'FORM_CHANGED',
-      message: 'Carrier portal form has changed. Automation needs updating.',
-      carrierCode,
-      recoverable: false, // FORM_CHANGED gets 1 retry at most
-      suggestedAction: getSuggestedAction('FORM_CHANGED'),
-    };
-  }
-
-  // Timeout errors
-  if (
-    errorLower.includes('timeout') ||
-    errorLower.includes('timed out') ||
-    errorLower.includes('deadline exceeded')
-  ) {
-    return {
-      code: 'TIMEOUT',
-      message: 'Request timed out while processing.',
-      carrierCode,
-      recoverable: true,
-      suggestedAction: getSuggestedAction('TIMEOUT'),
-    };
+  for (const { code, pattern, message, recoverable } of ERROR_CLASSIFICATION_PATTERNS) {
+    if (pattern.test(error)) {
+      return {
+        code,
+        message,
+        carrierCode,
+        recoverable,
+        suggestedAction: getSuggestedAction(code),
+      };
+    }
   }
 
   // Default to unknown
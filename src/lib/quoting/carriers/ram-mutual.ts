@@ -361,54 +361,59 @@ export const ramMutualFormatter: CarrierFormatter = {
     const missingFields: string[] = [];
     const warnings: string[] = [];
 
+    const personal = data.personal;
+    const property = data.property;
+    const auto = data.auto;
+
     // Personal info is always required
-    if (!data.personal?.firstName) {
+    if (!personal?.firstName) {
       missingFields.push('First Name');
     }
-    if (!data.personal?.lastName) {
+    if (!personal?.lastName) {
       missingFields.push('Last Name');
     }
-    if (!data.personal?.dateOfBirth) {
+    if (!personal?.dateOfBirth) {
       warnings.push('Date of Birth is recommended');
     }
 
     // Property fields (if property data exists)
-    if (data.property) {
-      if (!data.property.address?.street) {
+    if (property) {
+      const address = property.address;
+      if (!address?.street) {
         missingFields.push('Property Street Address');
       }
-      if (!data.property.address?.city) {
+      if (!address?.city) {
         missingFields.push('Property City');
       }
-      if (!data.property.address?.state) {
+      if (!address?.state) {
         missingFields.push('Property State');
       }
-      if (!data.property.address?.zipCode) {
+      if (!address?.zipCode) {
         missingFields.push('Property ZIP Code');
       }
 
       // RAM Mutual regional check - Wisconsin/Illinois focus
-      const state = data.property.address?.state?.toUpperCase();
+      const state = address?.state?.toUpperCase();
       if (state && !['WI', 'IL', 'WISCONSIN', 'ILLINOIS'].includes(state)) {
         warnings.push(`RAM Mutual primarily serves Wisconsin and Illinois. Property is in ${state}.`);
       }
 
-      if (!data.property.yearBuilt) {
+      if (!property.yearBuilt) {
         warnings.push('Year Built is recommended for accurate quotes');
       }
     }
 
     // Auto fields (if auto data exists)
-    if (data.auto) {
-      if (!data.auto.vehicles || data.auto.vehicles.length === 0) {
+    if (auto) {
+      if (!auto.vehicles || auto.vehicles.length === 0) {
         missingFields.push('At least one vehicle');
       }
-      if (!data.auto.drivers || data.auto.drivers.length === 0) {
+      if (!auto.drivers || auto.drivers.length === 0) {
         missingFields.push('At least one driver');
       }
 
       // Check each vehicle
-      data.auto.vehicles?.forEach((v, i) => {
+      auto.vehicles?.forEach((v, i) => {
         if (!v.year) warnings.push(`Vehicle ${i + 1}: Year is recommended`);
         if (!v.make) warnings.push(`Vehicle ${i + 1}: Make is recommended`);
         if (!v.model) warnings.push(`Vehicle ${i + 1}: Model is recommended`);
@@ -416,7 +421,7 @@ export const ramMutualFormatter: CarrierFormatter = {
       });
 
       // Check each driver
-      data.auto.drivers?.forEach((d, i) => {
+      auto.drivers?.forEach((d, i) => {
         if (!d.firstName || !d.lastName) {
           missingFields.push(`Driver ${i + 1}: Name`);
         }
@@ -343,53 +343,58 @@ export const travelersFormatter: CarrierFormatter = {
     const missingFields: string[] = [];
     const warnings: string[] = [];
 
+    const personal = data.personal;
+    const property = data.property;
+    const auto = data.auto;
+
     // Named insured required
-    if (!data.personal?.firstName) {
+    if (!personal?.firstName) {
       missingFields.push('First Name');
     }
-    if (!data.personal?.lastName) {
+    if (!personal?.lastName) {
       missingFields.push('Last Name');
     }
-    if (!data.personal?.dateOfBirth) {
+    if (!personal?.dateOfBirth) {
       warnings.push('Date of Birth is recommended');
     }
 
     // Location validation (if property exists)
-    if (data.property) {
-      if (!data.property.address?.street) {
+    if (property) {
+      const address = property.address;
+      if (!address?.street) {
         missingFields.push('Risk Address');
       }
-      if (!data.property.address?.city) {
+      if (!address?.city) {
         missingFields.push('City');
       }
-      if (!data.property.address?.state) {
+      if (!address?.state) {
         missingFields.push('State');
       }
-      if (!data.property.address?.zipCode) {
+      if (!address?.zipCode) {
         missingFields.push('ZIP Code');
       }
 
       // Travelers requires construction details
-      if (!data.property.yearBuilt) {
+      if (!property.yearBuilt) {
         warnings.push('Year Built is required for accurate quote');
       }
-      if (!data.property.constructionType) {
+      if (!property.constructionType) {
         warnings.push('Construction Type is recommended');
       }
     }
 
     // Auto validation
-    if (data.auto) {
+    if (auto) {
       // Travelers requires at least one driver
-      if (!data.auto.drivers || data.auto.drivers.length === 0) {
+      if (!auto.drivers || auto.drivers.length === 0) {
         missingFields.push('At least one driver');
       }
-      if (!data.auto.vehicles || data.auto.vehicles.length === 0) {
+      if (!auto.vehicles || auto.vehicles.length === 0) {
         missingFields.push('At least one vehicle');
       }
 
       // Validate drivers
-      data.auto.drivers?.forEach((d, i) => {
+      auto.drivers?.forEach((d, i) => {
         if (!d.firstName || !d.lastName) {
           missingFields.push(`Driver ${i + 1}: Name`);
         }
@@ -402,7 +407,7 @@ export const travelersFormatter: CarrierFormatter = {
       });
 
       // Validate vehicles
-      data.auto.vehicles?.forEach((v, i) => {
+      auto.vehicles?.forEach((v, i) => {
         if (!v.year) missingFields.push(`Vehicle ${i + 1}: Year`);
         if (!v.make) missingFields.push(`Vehicle ${i + 1}: Make`);
         if (!v.model) missingFields.push(`Vehicle ${i + 1}: Model`);
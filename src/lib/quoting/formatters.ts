@@ -8,6 +8,22 @@
  * AC-Q3.1-27: License number masking
  */
 
+// Intl.NumberFormat construction is expensive; build the shared USD
+// formatters once at module load instead of per keystroke/blur
+const USD_WHOLE_FORMAT = new Intl.NumberFormat('en-US', {
+  style: 'currency',
+  currency: 'USD',
+  minimumFractionDigits: 0,
+  maximumFractionDigits: 0,
+});
+
+const USD_CENTS_FORMAT = new Intl.NumberFormat('en-US', {
+  style: 'currency',
+  currency: 'USD',
+  minimumFractionDigits: 2,
+  maximumFractionDigits: 2,
+});
+
 /**
  * Format phone number as (XXX) XXX-XXXX while typing
  * AC-Q3.1-3: Auto-formats as user enters digits
@@ -73,12 +89,7 @@ export function formatCurrency(value: number | string | undefined | null): strin
     return '';
   }
 
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency: 'USD',
-    minimumFractionDigits: 0,
-    maximumFractionDigits: 0,
-  }).format(numValue);
+  return USD_WHOLE_FORMAT.format(numValue);
 }
 
 /**
@@ -106,14 +117,8 @@ export function formatCurrencyDisplay(
 
   // Check if original value had decimals
   const hasDecimals = preserveDecimals || (typeof value === 'string' && value.includes('.'));
-  const decimalPlaces = hasDecimals ? 2 : 0;
-
-  return new Intl.NumberFormat('en-US', {
-    style: 'currency',
-    currency: 'USD',
-    minimumFractionDigits: decimalPlaces,
-    maximumFractionDigits: decimalPlaces,
-  }).format(numValue);
+
+  return (hasDecimals ? USD_CENTS_FORMAT : USD_WHOLE_FORMAT).format(numValue);
 }
 
 /**
@@ -31,11 +31,14 @@ const DATE_PATTERNS = [
 /**
  * Currency patterns for detection.
  */
+// The amount fragment only accepts well-formed values (grouped thousands or
+// plain digits, optional decimals) - the ambiguous [\d,]+\.?\d* form it
+// replaces could backtrack quadratically on long near-miss strings
 const CURRENCY_PATTERNS = [
   // $1,234.56 or $1234.56
-  /^\$[\d,]+\.?\d*$/,
+  /^\$(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?$/,
   // 1,234.56 USD
-  /^[\d,]+\.?\d*\s*(USD|EUR|GBP|CAD|AUD)$/i,
+  /^(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?\s*(USD|EUR|GBP|CAD|AUD)$/i,
   // €1.234,56 (EU format)
   /^[€£¥][\d.]+,?\d*$/,
 ];
@@ -26,6 +26,12 @@ const PER_PAGE_TIMEOUT_MS = 3000; // 3 seconds per page
 const MAX_TIMEOUT_MS = 240000; // 240 seconds max (well under 400s wall clock)
 const EXTRACTION_VERSION = 3; // Must match src/types/compare.ts
 
+// Retry only the OpenAI HTTP call on transient failures - short backoff so a
+// blip doesn't fail the whole extraction, but total delay stays small
+// relative to the extraction timeout
+const MAX_FETCH_ATTEMPTS = 3;
+const FETCH_RETRY_BASE_MS = 500; // 0.5s, 1s, 2s
+
 /**
  * Calculate dynamic timeout based on page count.
  * Larger documents need more time for OpenAI to process.
@@ -270,6 +276,46 @@ const EXTRACTION_JSON_SCHEMA = {
   additionalProperties: false,
 } as const;
 
+/**
+ * POST to OpenAI with retry on transient failures.
+ *
+ * Retries network errors, 429, and 5xx responses with exponential backoff
+ * (0.5s/1s/2s). Wrapping just the HTTP call means a transient error doesn't
+ * fail the whole extraction. Non-retryable responses are returned to the
+ * caller; aborts from the extraction timeout are re-thrown immediately.
+ */
+async function fetchWithRetry(url: string, init: RequestInit): Promise<Response> {
+  let lastError: Error | null = null;
+
+  for (let attempt = 1; attempt <= MAX_FETCH_ATTEMPTS; attempt++) {
+    try {
+      const response = await fetch(url, init);
+
+      if ((response.status === 429 || response.status >= 500) && attempt < MAX_FETCH_ATTEMPTS) {
+        log.warn('Retryable OpenAI API response', { status: response.status, attempt });
+        await response.body?.cancel();
+      } else {
+        return response;
+      }
+    } catch (error) {
+      const err = error instanceof Error ? error : new Error(String(error));
+
+      // Timeout abort is terminal - the extraction deadline has passed
+      if (err.name === 'AbortError' || attempt === MAX_FETCH_ATTEMPTS) {
+        throw err;
+      }
+
+      lastError = err;
+      log.warn('OpenAI API request failed, retrying', { attempt, error: err.message });
+    }
+
+    const backoffMs = FETCH_RETRY_BASE_MS * Math.pow(2, attempt - 1);
+    await new Promise((resolve) => setTimeout(resolve, backoffMs));
+  }
+
+  throw lastError ?? new Error('OpenAI request failed after retries');
+}
+
 // Main handler
 Deno.serve(async (req: Request) => {
   const startTime = Date.now();
@@ -382,7 +428,7 @@ Deno.serve(async (req: Request) => {
         temperature: 0.1,
       };
 
-      const response = await fetch('https://api.openai.com/v1/chat/completions', {
+      const response = await fetchWithRetry('https://api.openai.com/v1/chat/completions', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -27,6 +27,7 @@ import { createClient } from 'jsr:@supabase/supabase-js@2';
 import {
   parseDocumentWithLlamaParse,
   convertToDoclingResult,
+  withRetry,
   LlamaParseError,
   UploadError,
   PollingError,
@@ -47,6 +48,10 @@ const CHARS_PER_TOKEN = 4;
 // Total processing timeout for the entire pipeline
 const TOTAL_PROCESSING_TIMEOUT_MS = 480000; // 480s (8 min) - ensures error handling runs before platform timeout
 
+// Cap upstream error bodies embedded in thrown errors - failed API responses
+// can be full HTML pages and only the head is useful for diagnostics
+const MAX_ERROR_BODY_LENGTH = 2000;
+
 // Story 11.3 (AC-11.3.4): Error classification
 // Story 11.5 (AC-11.5.1): Extended error classification with categories
 // PERMANENT errors should NOT be auto-retried (user action required)
@@ -244,9 +249,17 @@ const STAGE_DISPLAY_NAMES: Record<ProgressData['stage'], string> = {
   embedding: 'Indexing for search',
 };
 
+// Minimum log level, configurable via LOG_LEVEL env ('info' | 'warn' | 'error').
+// Lets production deployments silence the per-stage info chatter on the
+// processing hot path without touching code.
+const LOG_LEVEL_RANKS: Record<string, number> = { info: 0, warn: 1, error: 2 };
+const MIN_LOG_RANK =
+  LOG_LEVEL_RANKS[(Deno.env.get('LOG_LEVEL') || 'info').toLowerCase()] ?? 0;
+
 // Structured logging
 const log = {
   info: (message: string, data?: LogData): void => {
+    if (MIN_LOG_RANK > 0) return;
     console.log(JSON.stringify({
       level: 'info',
       message,
@@ -255,6 +268,7 @@ const log = {
     }));
   },
   warn: (message: string, data?: LogData): void => {
+    if (MIN_LOG_RANK > 1) return;
     console.warn(JSON.stringify({
       level: 'warn',
       message,
@@ -288,23 +302,25 @@ function checkProcessingTimeout(startTime: number): void {
   }
 }
 
-// Main handler
-Deno.serve(async (req: Request) => {
-  const startTime = Date.now();
+// Environment is fixed for the life of the isolate - read once at module
+// load instead of on every request. Presence is still validated per request
+// so a misconfigured function returns a structured 500.
+const supabaseUrl = Deno.env.get('SUPABASE_URL');
+const supabaseServiceKey = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY');
+const openaiKey = Deno.env.get('OPENAI_API_KEY');
 
-  // Get environment variables
-  const supabaseUrl = Deno.env.get('SUPABASE_URL');
-  const supabaseServiceKey = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY');
-  const openaiKey = Deno.env.get('OPENAI_API_KEY');
+// Story 13.2 (AC-13.2.5): LLAMA_CLOUD_API_KEY required for LlamaParse
+const llamaCloudApiKey = Deno.env.get('LLAMA_CLOUD_API_KEY');
 
-  // Story 13.2 (AC-13.2.5): LLAMA_CLOUD_API_KEY required for LlamaParse
-  const llamaCloudApiKey = Deno.env.get('LLAMA_CLOUD_API_KEY');
+// AC-13.2.5: Log configuration on startup (without exposing key)
+log.info('Edge Function configuration', {
+  hasLlamaCloudApiKey: !!llamaCloudApiKey,
+  hasOpenaiKey: !!openaiKey,
+});
 
-  // AC-13.2.5: Log configuration on startup (without exposing key)
-  log.info('Edge Function configuration', {
-    hasLlamaCloudApiKey: !!llamaCloudApiKey,
-    hasOpenaiKey: !!openaiKey,
-  });
+// Main handler
+Deno.serve(async (req: Request) => {
+  const startTime = Date.now();
 
   // AC-13.2.5: Fail fast if API key not configured
   if (!supabaseUrl || !supabaseServiceKey || !openaiKey || !llamaCloudApiKey) {
@@ -314,7 +330,7 @@ Deno.serve(async (req: Request) => {
     if (!openaiKey) missing.push('OPENAI_API_KEY');
     if (!llamaCloudApiKey) missing.push('LLAMA_CLOUD_API_KEY');
 
-    log.error('Missing environment variables', { missing });
+    log.error('Missing environment variables', new Error('Configuration incomplete'), { missing });
 
     return new Response(
       JSON.stringify({
@@ -426,8 +442,8 @@ Deno.serve(async (req: Request) => {
     );
 
     // Step 4: Download PDF from Storage
-    const pdfBuffer = await downloadFromStorage(supabase, processingStoragePath);
-    log.info('PDF downloaded', { documentId: processingDocumentId, size: pdfBuffer.byteLength });
+    const pdfBlob = await downloadFromStorage(supabase, processingStoragePath);
+    log.info('PDF downloaded', { documentId: processingDocumentId, size: pdfBlob.size });
 
     // Story 5.12: Report download complete
     await updateJobProgress(
@@ -435,7 +451,7 @@ Deno.serve(async (req: Request) => {
       processingDocumentId,
       'downloading',
       100,
-      estimateTimeRemaining(pdfBuffer.byteLength, 'downloading', 100),
+      estimateTimeRemaining(pdfBlob.size, 'downloading', 100),
       true
     );
     checkProcessingTimeout(startTime); // AC-5.8.1.5
@@ -448,16 +464,16 @@ Deno.serve(async (req: Request) => {
       processingDocumentId,
       'parsing',
       0,
-      estimateTimeRemaining(pdfBuffer.byteLength, 'parsing', 0),
+      estimateTimeRemaining(pdfBlob.size, 'parsing', 0),
       true
     );
 
     const parseStartTime = Date.now();
 
     // AC-13.2.1: Call LlamaParse with progress callback
-    // Convert Uint8Array to ArrayBuffer for LlamaParse client
+    // Blob is passed straight through to the upload - no intermediate copy
     const llamaParseResult = await parseDocumentWithLlamaParse(
-      pdfBuffer.buffer as ArrayBuffer,
+      pdfBlob,
       processingStoragePath,
       { apiKey: llamaCloudApiKey },
       // AC-13.2.2: Progress callback for real-time updates
@@ -467,7 +483,7 @@ Deno.serve(async (req: Request) => {
           processingDocumentId,
           'parsing',
           percent,
-          estimateTimeRemaining(pdfBuffer.byteLength, 'parsing', percent),
+          estimateTimeRemaining(pdfBlob.size, 'parsing', percent),
           percent === 0 || percent === 100 // Force update at stage transitions
         );
       }
@@ -482,7 +498,7 @@ Deno.serve(async (req: Request) => {
       processingDocumentId,
       'parsing',
       100,
-      estimateTimeRemaining(pdfBuffer.byteLength, 'parsing', 100),
+      estimateTimeRemaining(pdfBlob.size, 'parsing', 100),
       true
     );
 
@@ -501,7 +517,7 @@ Deno.serve(async (req: Request) => {
       processingDocumentId,
       'chunking',
       0,
-      estimateTimeRemaining(pdfBuffer.byteLength, 'chunking', 0),
+      estimateTimeRemaining(pdfBlob.size, 'chunking', 0),
       true
     );
 
@@ -513,7 +529,7 @@ Deno.serve(async (req: Request) => {
       processingDocumentId,
       'chunking',
       100,
-      estimateTimeRemaining(pdfBuffer.byteLength, 'chunking', 100),
+      estimateTimeRemaining(pdfBlob.size, 'chunking', 100),
       true
     );
 
@@ -523,7 +539,10 @@ Deno.serve(async (req: Request) => {
     // Step 6.5: AI Tagging (Story F2-3)
     // AC-F2-3.1: Generate tags, AC-F2-3.2: Generate summary, AC-F2-3.3: Infer document type
     // AC-F2-3.4: 5-second timeout, AC-F2-3.5: Graceful degradation
-    await performAITagging(supabase, processingDocumentId, chunks, openaiKey);
+    // Runs concurrently with embedding generation - the two stages are
+    // independent and tagging never throws (AC-F2-3.5), so there is no
+    // reason to serialize the pipeline behind its 5s timeout
+    const taggingPromise = performAITagging(supabase, processingDocumentId, chunks, openaiKey);
 
     // Step 7: Generate embeddings
     // Story 5.12: Report embedding progress with batch-level updates
@@ -532,7 +551,7 @@ Deno.serve(async (req: Request) => {
       processingDocumentId,
       'embedding',
       0,
-      estimateTimeRemaining(pdfBuffer.byteLength, 'embedding', 0),
+      estimateTimeRemaining(pdfBlob.size, 'embedding', 0),
       true
     );
 
@@ -548,7 +567,7 @@ Deno.serve(async (req: Request) => {
           processingDocumentId,
           'embedding',
           progress,
-          estimateTimeRemaining(pdfBuffer.byteLength, 'embedding', progress)
+          estimateTimeRemaining(pdfBlob.size, 'embedding', progress)
         );
       }
     );
@@ -567,6 +586,9 @@ Deno.serve(async (req: Request) => {
       documentId: processingDocumentId,
       duration: Date.now() - embeddingsStartTime,
     });
+
+    // Ensure tagging has settled before document status moves to 'ready'
+    await taggingPromise;
     checkProcessingTimeout(startTime); // AC-5.8.1.5
 
     // Step 8: Insert chunks into database
@@ -688,8 +710,6 @@ Deno.serve(async (req: Request) => {
     // Even on failure, try to trigger the next job (AC-4.7.3)
     const nextPendingJob = await getNextPendingJob(supabase, agencyId);
     if (nextPendingJob) {
-      const supabaseUrl = Deno.env.get('SUPABASE_URL')!;
-      const supabaseServiceKey = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY')!;
       triggerNextJob(supabaseUrl, supabaseServiceKey, nextPendingJob.document_id, agencyId).catch((triggerErr) => {
         log.warn('Failed to trigger next job after failure', { error: triggerErr.message });
       });
@@ -715,7 +735,7 @@ Deno.serve(async (req: Request) => {
 async function downloadFromStorage(
   supabase: ReturnType<typeof createClient>,
   storagePath: string
-): Promise<Uint8Array> {
+): Promise<Blob> {
   const { data, error } = await supabase.storage
     .from('documents')
     .download(storagePath);
@@ -724,7 +744,9 @@ async function downloadFromStorage(
     throw new Error(`Failed to download PDF: ${error?.message || 'No data'}`);
   }
 
-  return new Uint8Array(await data.arrayBuffer());
+  // Return the Blob as-is - avoids materializing the whole file into an
+  // extra byte array before it is handed to the parser
+  return data;
 }
 
 // ============================================================================
@@ -752,6 +774,12 @@ const SEPARATORS = ['\n\n', '\n', '. ', ' '];
 // Table detection regex - matches complete markdown tables
 const TABLE_PATTERN = /(\|[^\n]+\|\n\|[-:| ]+\|\n(?:\|[^\n]+\|\n?)+)/g;
 
+// Table placeholder inserted by extractTablesWithPlaceholders()
+const TABLE_PLACEHOLDER_PATTERN = /\{\{TABLE_\d+\}\}/g;
+
+// Page marker immediately preceding the first page's content
+const TRAILING_PAGE_MARKER_PATTERN = /---\s*PAGE\s+\d+\s*---\s*$/i;
+
 /**
  * Extract tables from content and replace with placeholders.
  * Story 5.9 (AC-5.9.3): Tables preserved as single chunks
@@ -916,19 +944,25 @@ function splitByPages(markdown: string, pageMarkers: PageMarker[]): PageContent[
     return [{ pageNumber: 1, content: markdown }];
   }
 
+  // Slice page content straight out of the marker indices computed by
+  // extractPageMarkersWithIndices() - one substring per page instead of
+  // regex-splitting the whole document into intermediate copies
   const pages: PageContent[] = [];
-  const pattern = /---\s*PAGE\s+(\d+)\s*---/gi;
-  const parts = markdown.split(pattern);
-
-  let currentPage = 1;
-  for (let i = 0; i < parts.length; i++) {
-    const part = parts[i];
-    if (/^\d+$/.test(part.trim())) {
-      currentPage = parseInt(part.trim(), 10);
-      continue;
-    }
-    if (part.trim()) {
-      pages.push({ pageNumber: currentPage, content: part.trim() });
+
+  // Content before the first marker (rare) is attributed to page 1,
+  // matching the previous split behavior
+  const leading = markdown
+    .slice(0, pageMarkers[0].startIndex)
+    .replace(TRAILING_PAGE_MARKER_PATTERN, '')
+    .trim();
+  if (leading) {
+    pages.push({ pageNumber: 1, content: leading });
+  }
+
+  for (const marker of pageMarkers) {
+    const content = markdown.slice(marker.startIndex, marker.endIndex).trim();
+    if (content) {
+      pages.push({ pageNumber: marker.pageNumber, content });
     }
   }
 
@@ -956,7 +990,7 @@ function chunkPageWithTableAwareness(
   let chunkIndex = startIndex;
 
   for (const chunk of textChunks) {
-    const placeholderMatches = chunk.match(/\{\{TABLE_\d+\}\}/g);
+    const placeholderMatches = chunk.match(TABLE_PLACEHOLDER_PATTERN);
 
     if (placeholderMatches && placeholderMatches.length > 0) {
       let remaining = chunk;
@@ -1077,51 +1111,37 @@ async function generateEmbeddingsWithRetry(
   return embeddings;
 }
 
-async function generateBatchWithRetry(texts: string[], apiKey: string): Promise<number[][]> {
-  let lastError: Error | null = null;
-  let delay = 1000;
-
-  // Retry 3 times (AC-4.6.10)
-  for (let attempt = 1; attempt <= 3; attempt++) {
-    try {
-      const response = await fetch(OPENAI_API_URL, {
-        method: 'POST',
-        headers: {
-          Authorization: `Bearer ${apiKey}`,
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          model: EMBEDDING_MODEL,
-          input: texts,
-          dimensions: EMBEDDING_DIMENSIONS,
-        }),
-      });
-
-      if (!response.ok) {
-        const errorText = await response.text();
-        throw new Error(`OpenAI API error: ${response.status} - ${errorText}`);
-      }
-
-      const data = await response.json() as {
-        data: Array<{ index: number; embedding: number[] }>;
-      };
+// Retry 3 times with exponential backoff (AC-4.6.10) via the shared
+// withRetry helper - same 1s/2s/4s schedule the LlamaParse calls use
+function generateBatchWithRetry(texts: string[], apiKey: string): Promise<number[][]> {
+  return withRetry(async () => {
+    const response = await fetch(OPENAI_API_URL, {
+      method: 'POST',
+      headers: {
+        Authorization: `Bearer ${apiKey}`,
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify({
+        model: EMBEDDING_MODEL,
+        input: texts,
+        dimensions: EMBEDDING_DIMENSIONS,
+      }),
+    });
 
-      // Sort by index and extract embeddings
-      return data.data
-        .sort((a, b) => a.index - b.index)
-        .map((item) => item.embedding);
-    } catch (error) {
-      lastError = error instanceof Error ? error : new Error(String(error));
-      log.warn('Embedding batch failed', { attempt, error: lastError.message });
-
-      if (attempt < 3) {
-        await sleep(delay);
-        delay *= 2;
-      }
+    if (!response.ok) {
+      const errorText = (await response.text()).slice(0, MAX_ERROR_BODY_LENGTH);
+      throw new Error(`OpenAI API error: ${response.status} - ${errorText}`);
     }
-  }
 
-  throw lastError || new Error('Embeddings generation failed');
+    const data = await response.json() as {
+      data: Array<{ index: number; embedding: number[] }>;
+    };
+
+    // Sort by index and extract embeddings
+    return data.data
+      .sort((a, b) => a.index - b.index)
+      .map((item) => item.embedding);
+  }, 'generateEmbeddingsBatch');
 }
 
 // ============================================================================
@@ -1247,7 +1267,7 @@ async function triggerNextJob(
   });
 
   if (!response.ok) {
-    const errorText = await response.text();
+    const errorText = (await response.text()).slice(0, MAX_ERROR_BODY_LENGTH);
     throw new Error(`Failed to trigger next job: ${response.status} - ${errorText}`);
   }
 }
@@ -1277,7 +1297,7 @@ async function triggerPhase2Extraction(
   });
 
   if (!response.ok) {
-    const errorText = await response.text();
+    const errorText = (await response.text()).slice(0, MAX_ERROR_BODY_LENGTH);
     throw new Error(`Failed to trigger Phase 2 extraction: ${response.status} - ${errorText}`);
   }
 
@@ -1388,22 +1408,6 @@ async function insertChunks(
   }
 }
 
-// ============================================================================
-// Story 10.12: Quote Extraction at Upload Time
-// ============================================================================
-
-/**
- * Quote extraction timeout in milliseconds.
- * AC-10.12.8: 60-second timeout for extraction
- */
-const QUOTE_EXTRACTION_TIMEOUT_MS = 60000;
-
-/**
- * Extraction version for cache invalidation.
- * Must match EXTRACTION_VERSION in src/types/compare.ts
- */
-const EXTRACTION_VERSION = 3;
-
 // ============================================================================
 // Story F2-3: AI Tagging
 // ============================================================================
@@ -1521,7 +1525,7 @@ async function performAITagging(
     clearTimeout(timeout);
 
     if (!response.ok) {
-      const errorText = await response.text();
+      const errorText = (await response.text()).slice(0, MAX_ERROR_BODY_LENGTH);
       log.warn('AI tagging API error', { documentId, status: response.status, error: errorText });
       return;
     }
@@ -1602,408 +1606,6 @@ async function performAITagging(
   }
 }
 
-// ============================================================================
-// Story 10.12: Quote Extraction at Upload Time
-// ============================================================================
-
-/**
- * System prompt for insurance quote extraction.
- * Mirrors the prompt from src/lib/compare/extraction.ts
- */
-const EXTRACTION_SYSTEM_PROMPT = `You are an expert insurance document analyst.
-Your task is to extract structured data from insurance quote documents.
-
-IMPORTANT GUIDELINES:
-- Extract exact values as they appear in the document
-- For each extracted item, include the page number(s) where it appears
-- If a field is not found in the document, omit it or set to null
-- Do NOT guess or infer values that are not explicitly stated
-- For currency amounts, extract the numeric value only (no $ or commas)
-- For dates, use YYYY-MM-DD format
-
-COVERAGE TYPE MAPPINGS:
-- "General Liability", "CGL", "Commercial General Liability" → general_liability
-- "Property", "Building", "Business Personal Property", "BPP" → property
-- "Auto Liability", "Automobile Liability", "Commercial Auto" → auto_liability
-- "Physical Damage", "Collision", "Comprehensive", "Auto Physical" → auto_physical_damage
-- "Umbrella", "Excess Liability", "Excess" → umbrella
-- "Workers Compensation", "WC", "Workers' Comp" → workers_comp
-- "Professional Liability", "E&O", "Errors and Omissions" → professional_liability
-- "Cyber Liability", "Data Breach", "Network Security" → cyber
-- "EPLI", "Employment Practices Liability" → epli
-- "D&O", "Directors and Officers" → d_and_o
-- "Crime", "Fidelity", "Employee Dishonesty" → crime
-- Other coverages → other
-
-EXCLUSION CATEGORY MAPPINGS:
-- Flood, water damage → flood
-- Earthquake, earth movement → earthquake
-- Pollution, contamination → pollution
-- Mold, fungus → mold
-- Cyber, data breach (when excluded) → cyber
-- Employment practices (when excluded) → employment
-- Other exclusions → other
-
-LIMIT TYPE MAPPINGS:
-- "Each Occurrence", "Per Occurrence", "Per Claim" → per_occurrence
-- "Aggregate", "Annual Aggregate", "Policy Aggregate" → aggregate
-- "Per Person", "Each Person" → per_person
-- "CSL", "Combined Single Limit" → combined_single
-
-Extract all available information and include source page numbers for traceability.`;
-
-/**
- * JSON Schema for quote extraction structured output.
- * Matches quoteExtractionSchema from src/types/compare.ts
- */
-const EXTRACTION_JSON_SCHEMA = {
-  type: 'object',
-  properties: {
-    carrierName: { type: ['string', 'null'], description: 'Insurance carrier/company name' },
-    policyNumber: { type: ['string', 'null'], description: 'Policy or quote number' },
-    namedInsured: { type: ['string', 'null'], description: 'Named insured (policyholder)' },
-    effectiveDate: { type: ['string', 'null'], description: 'Policy effective date (YYYY-MM-DD)' },
-    expirationDate: { type: ['string', 'null'], description: 'Policy expiration date (YYYY-MM-DD)' },
-    annualPremium: { type: ['number', 'null'], description: 'Total annual premium in USD' },
-    coverages: {
-      type: 'array',
-      items: {
-        type: 'object',
-        properties: {
-          type: {
-            type: 'string',
-            enum: ['general_liability', 'property', 'auto_liability', 'auto_physical_damage',
-                   'umbrella', 'workers_comp', 'professional_liability', 'cyber', 'other',
-                   'epli', 'd_and_o', 'crime', 'pollution', 'inland_marine', 'builders_risk',
-                   'business_interruption', 'product_liability', 'garage_liability',
-                   'liquor_liability', 'medical_malpractice', 'fiduciary']
-          },
-          name: { type: 'string' },
-          limit: { type: ['number', 'null'] },
-          sublimit: { type: ['number', 'null'] },
-          limitType: { type: ['string', 'null'], enum: ['per_occurrence', 'aggregate', 'per_person', 'combined_single', null] },
-          deductible: { type: ['number', 'null'] },
-          description: { type: 'string' },
-          sourcePages: { type: 'array', items: { type: 'integer' } },
-          aggregateLimit: { type: ['number', 'null'] },
-          selfInsuredRetention: { type: ['number', 'null'] },
-          coinsurance: { type: ['number', 'null'] },
-          waitingPeriod: { type: ['string', 'null'] },
-          indemnityPeriod: { type: ['string', 'null'] },
-        },
-        required: ['type', 'name', 'limit', 'sublimit', 'limitType', 'deductible', 'description', 'sourcePages', 'aggregateLimit', 'selfInsuredRetention', 'coinsurance', 'waitingPeriod', 'indemnityPeriod'],
-        additionalProperties: false,
-      },
-    },
-    exclusions: {
-      type: 'array',
-      items: {
-        type: 'object',
-        properties: {
-          name: { type: 'string' },
-          description: { type: 'string' },
-          category: { type: 'string', enum: ['flood', 'earthquake', 'pollution', 'mold', 'cyber', 'employment', 'other'] },
-          sourcePages: { type: 'array', items: { type: 'integer' } },
-        },
-        required: ['name', 'description', 'category', 'sourcePages'],
-        additionalProperties: false,
-      },
-    },
-    deductibles: {
-      type: 'array',
-      items: {
-        type: 'object',
-        properties: {
-          type: { type: 'string' },
-          amount: { type: 'number' },
-          appliesTo: { type: 'string' },
-          sourcePages: { type: 'array', items: { type: 'integer' } },
-        },
-        required: ['type', 'amount', 'appliesTo', 'sourcePages'],
-        additionalProperties: false,
-      },
-    },
-    policyMetadata: {
-      type: ['object', 'null'],
-      properties: {
-        formType: { type: ['string', 'null'], enum: ['iso', 'proprietary', 'manuscript', null] },
-        formNumbers: { type: 'array', items: { type: 'string' } },
-        policyType: { type: ['string', 'null'], enum: ['occurrence', 'claims-made', null] },
-        retroactiveDate: { type: ['string', 'null'] },
-        extendedReportingPeriod: { type: ['string', 'null'] },
-        auditType: { type: ['string', 'null'], enum: ['annual', 'monthly', 'final', 'none', null] },
-        sourcePages: { type: 'array', items: { type: 'integer' } },
-      },
-      required: ['formType', 'formNumbers', 'policyType', 'retroactiveDate', 'extendedReportingPeriod', 'auditType', 'sourcePages'],
-      additionalProperties: false,
-    },
-    endorsements: {
-      type: 'array',
-      items: {
-        type: 'object',
-        properties: {
-          formNumber: { type: 'string' },
-          name: { type: 'string' },
-          type: { type: 'string', enum: ['broadening', 'restricting', 'conditional'] },
-          description: { type: 'string' },
-          affectedCoverage: { type: ['string', 'null'] },
-          sourcePages: { type: 'array', items: { type: 'integer' } },
-        },
-        required: ['formNumber', 'name', 'type', 'description', 'affectedCoverage', 'sourcePages'],
-        additionalProperties: false,
-      },
-    },
-    carrierInfo: {
-      type: ['object', 'null'],
-      properties: {
-        amBestRating: { type: ['string', 'null'] },
-        amBestFinancialSize: { type: ['string', 'null'] },
-        naicCode: { type: ['string', 'null'] },
-        admittedStatus: { type: ['string', 'null'], enum: ['admitted', 'non-admitted', 'surplus', null] },
-        claimsPhone: { type: ['string', 'null'] },
-        underwriter: { type: ['string', 'null'] },
-        sourcePages: { type: 'array', items: { type: 'integer' } },
-      },
-      required: ['amBestRating', 'amBestFinancialSize', 'naicCode', 'admittedStatus', 'claimsPhone', 'underwriter', 'sourcePages'],
-      additionalProperties: false,
-    },
-    premiumBreakdown: {
-      type: ['object', 'null'],
-      properties: {
-        basePremium: { type: ['number', 'null'] },
-        coveragePremiums: {
-          type: 'array',
-          items: {
-            type: 'object',
-            properties: {
-              coverage: { type: 'string' },
-              premium: { type: 'number' },
-            },
-            required: ['coverage', 'premium'],
-            additionalProperties: false,
-          },
-        },
-        taxes: { type: ['number', 'null'] },
-        fees: { type: ['number', 'null'] },
-        brokerFee: { type: ['number', 'null'] },
-        surplusLinesTax: { type: ['number', 'null'] },
-        totalPremium: { type: 'number' },
-        paymentPlan: { type: ['string', 'null'] },
-        sourcePages: { type: 'array', items: { type: 'integer' } },
-      },
-      required: ['basePremium', 'coveragePremiums', 'taxes', 'fees', 'brokerFee', 'surplusLinesTax', 'totalPremium', 'paymentPlan', 'sourcePages'],
-      additionalProperties: false,
-    },
-  },
-  required: ['carrierName', 'policyNumber', 'namedInsured', 'effectiveDate', 'expirationDate', 'annualPremium', 'coverages', 'exclusions', 'deductibles', 'policyMetadata', 'endorsements', 'carrierInfo', 'premiumBreakdown'],
-  additionalProperties: false,
-} as const;
-
-/**
- * Perform quote extraction on document chunks.
- * Story 10.12: Extracts structured quote data at upload time.
- *
- * AC-10.12.1: Triggered after AI tagging for quote documents
- * AC-10.12.2: Stores result in documents.extraction_data
- * AC-10.12.3: Graceful degradation - failures don't block processing
- * AC-10.12.4: Only runs for document_type = 'quote' or null
- * AC-10.12.8: 60-second timeout
- */
-async function performQuoteExtraction(
-  supabase: ReturnType<typeof createClient>,
-  documentId: string,
-  agencyId: string,
-  chunks: DocumentChunk[],
-  openaiApiKey: string
-): Promise<void> {
-  const startTime = Date.now();
-
-  // AC-10.12.4: Check document type - only extract for quotes
-  const { data: docData } = await supabase
-    .from('documents')
-    .select('document_type')
-    .eq('id', documentId)
-    .single();
-
-  const documentType = docData?.document_type;
-
-  // Skip extraction for general documents
-  if (documentType === 'general') {
-    log.info('Quote extraction skipped: document_type is general', { documentId });
-    return;
-  }
-
-  log.info('Starting quote extraction', {
-    documentId,
-    documentType: documentType || 'null (treating as quote)',
-    chunkCount: chunks.length,
-  });
-
-  // Build context from all chunks with page markers
-  const context = chunks
-    .map((c) => {
-      return `--- PAGE ${c.pageNumber} ---\n${c.content}`;
-    })
-    .join('\n\n');
-
-  if (!context.trim()) {
-    log.warn('Quote extraction skipped: no content', { documentId });
-    return;
-  }
-
-  const controller = new AbortController();
-  const timeout = setTimeout(() => controller.abort(), QUOTE_EXTRACTION_TIMEOUT_MS);
-
-  try {
-    // Build request for OpenAI structured outputs
-    const requestBody = {
-      model: 'gpt-5.1',
-      messages: [
-        { role: 'system', content: EXTRACTION_SYSTEM_PROMPT },
-        {
-          role: 'user',
-          content: `Extract structured insurance quote data from the following document:\n\n${context}`,
-        },
-      ],
-      response_format: {
-        type: 'json_schema',
-        json_schema: {
-          name: 'quote_extraction',
-          strict: true,
-          schema: EXTRACTION_JSON_SCHEMA,
-        },
-      },
-      temperature: 0.1, // Low temperature for consistent extraction
-    };
-
-    const response = await fetch('https://api.openai.com/v1/chat/completions', {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'Authorization': `Bearer ${openaiApiKey}`,
-      },
-      body: JSON.stringify(requestBody),
-      signal: controller.signal,
-    });
-
-    clearTimeout(timeout);
-
-    if (!response.ok) {
-      const errorText = await response.text();
-      throw new Error(`OpenAI API error: ${response.status} - ${errorText}`);
-    }
-
-    const data = await response.json();
-    const content = data.choices?.[0]?.message?.content;
-
-    if (!content) {
-      throw new Error('No content in extraction response');
-    }
-
-    // Parse the extraction result
-    const extraction = JSON.parse(content);
-
-    // Add metadata fields
-    extraction.extractedAt = new Date().toISOString();
-    extraction.modelUsed = 'gpt-5.1';
-
-    // AC-10.12.2: Store extraction in documents table
-    const { error: updateError } = await supabase
-      .from('documents')
-      .update({
-        extraction_data: extraction,
-        extraction_version: EXTRACTION_VERSION,
-        extraction_error: null, // Clear any previous error
-        updated_at: new Date().toISOString(),
-      })
-      .eq('id', documentId);
-
-    if (updateError) {
-      throw new Error(`Failed to store extraction: ${updateError.message}`);
-    }
-
-    // AC-10.12.2: Also cache in quote_extractions table for comparison flow compatibility
-    const { error: cacheError } = await supabase
-      .from('quote_extractions')
-      .upsert(
-        {
-          document_id: documentId,
-          agency_id: agencyId,
-          extracted_data: extraction,
-          extraction_version: EXTRACTION_VERSION,
-          updated_at: new Date().toISOString(),
-        },
-        {
-          onConflict: 'document_id',
-          ignoreDuplicates: false,
-        }
-      );
-
-    if (cacheError) {
-      log.warn('Failed to cache extraction in quote_extractions', {
-        documentId,
-        error: cacheError.message,
-      });
-      // Don't throw - documents table update succeeded
-    }
-
-    const duration = Date.now() - startTime;
-    log.info('Quote extraction completed', {
-      documentId,
-      duration,
-      coverageCount: extraction.coverages?.length || 0,
-      exclusionCount: extraction.exclusions?.length || 0,
-      carrierName: extraction.carrierName || null,
-      annualPremium: extraction.annualPremium || null,
-    });
-
-  } catch (error) {
-    clearTimeout(timeout);
-
-    const err = error instanceof Error ? error : new Error(String(error));
-    const duration = Date.now() - startTime;
-
-    // AC-10.12.3: Store error details in extraction_error column
-    const { error: updateError } = await supabase
-      .from('documents')
-      .update({
-        extraction_error: err.message,
-        extraction_data: null,
-        extraction_version: null,
-        updated_at: new Date().toISOString(),
-      })
-      .eq('id', documentId);
-
-    if (updateError) {
-      log.warn('Failed to store extraction error', { documentId, error: updateError.message });
-    }
-
-    if (err.name === 'AbortError') {
-      log.warn('Quote extraction timeout', {
-        documentId,
-        duration,
-        timeoutMs: QUOTE_EXTRACTION_TIMEOUT_MS,
-      });
-    } else {
-      log.warn('Quote extraction failed', {
-        documentId,
-        duration,
-        error: err.message,
-      });
-    }
-
-    // AC-10.12.3: Graceful degradation - don't throw, just log and continue
-  }
-}
-
-// ============================================================================
-// Utilities
-// ============================================================================
-
-function sleep(ms: number): Promise<void> {
-  return new Promise((resolve) => setTimeout(resolve, ms));
-}
-
 // ============================================================================
 // Story 5.12: Progress Reporting
 // ============================================================================
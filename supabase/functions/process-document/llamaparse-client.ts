@@ -24,8 +24,10 @@ export interface LlamaParseConfig {
   apiKey: string;
   /** Base URL for LlamaParse API. Default: https://api.cloud.llamaindex.ai */
   baseUrl?: string;
-  /** Polling interval in milliseconds. Default: 2000 (2 seconds) */
+  /** Initial polling interval in milliseconds. Default: 2000 (2 seconds) */
   pollingIntervalMs?: number;
+  /** Ceiling for the backed-off polling interval. Default: 10000 (10 seconds) */
+  maxPollingIntervalMs?: number;
   /** Maximum wait time in milliseconds. Default: 300000 (5 minutes) */
   maxWaitTimeMs?: number;
 }
@@ -39,6 +41,8 @@ export interface LlamaParseResult {
   markdown: string;
   /** Number of pages in the document */
   pageCount: number;
+  /** Page markers extracted from the markdown (with character indices) */
+  pageMarkers: PageMarker[];
   /** LlamaParse job ID for reference */
   jobId: string;
   /** Total processing time in milliseconds */
@@ -85,9 +89,14 @@ interface DoclingResult {
 
 const DEFAULT_BASE_URL = 'https://api.cloud.llamaindex.ai';
 const DEFAULT_POLLING_INTERVAL_MS = 2000;
+const DEFAULT_MAX_POLLING_INTERVAL_MS = 10000;
+const POLLING_BACKOFF_FACTOR = 1.5;
 const DEFAULT_MAX_WAIT_TIME_MS = 300000; // 5 minutes
 const MAX_RETRY_ATTEMPTS = 3;
 const INITIAL_BACKOFF_MS = 1000;
+// Cap error bodies attached to thrown errors - API error pages can be large
+// HTML documents and we only need the head of the response for diagnostics
+const MAX_ERROR_BODY_LENGTH = 2000;
 
 // Constraint 2: Page marker regex MUST match existing splitByPages() pattern
 const PAGE_MARKER_PATTERN = /---\s*PAGE\s+(\d+)\s*---/gi;
@@ -101,8 +110,16 @@ interface LogData {
   [key: string]: unknown;
 }
 
+// Minimum log level, configurable via LOG_LEVEL env ('info' | 'warn' | 'error').
+// Keeps the upload/poll/result hot path quiet in production when only
+// warnings and errors are wanted.
+const LOG_LEVEL_RANKS: Record<string, number> = { info: 0, warn: 1, error: 2 };
+const MIN_LOG_RANK =
+  LOG_LEVEL_RANKS[(Deno.env.get('LOG_LEVEL') || 'info').toLowerCase()] ?? 0;
+
 const log = {
   info: (message: string, data?: LogData): void => {
+    if (MIN_LOG_RANK > 0) return;
     console.log(
       JSON.stringify({
         level: 'info',
@@ -114,6 +131,7 @@ const log = {
     );
   },
   warn: (message: string, data?: LogData): void => {
+    if (MIN_LOG_RANK > 1) return;
     console.warn(
       JSON.stringify({
         level: 'warn',
@@ -203,7 +221,7 @@ export class ResultError extends LlamaParseError {
 /**
  * Sleep for specified milliseconds.
  */
-function sleep(ms: number): Promise<void> {
+export function sleep(ms: number): Promise<void> {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
@@ -211,12 +229,15 @@ function sleep(ms: number): Promise<void> {
  * Execute a function with exponential backoff retry.
  * AC-13.1.6: Retry failed requests (max 3 attempts) with exponential backoff (1s, 2s, 4s)
  *
+ * Shared by the LlamaParse operations below and the embedding batches in
+ * index.ts - non-LlamaParseError failures are treated as retryable.
+ *
  * @param fn - Function to execute
  * @param operationName - Name for logging
  * @returns Result of successful execution
  * @throws Last error after all retries exhausted
  */
-async function withRetry<T>(fn: () => Promise<T>, operationName: string): Promise<T> {
+export async function withRetry<T>(fn: () => Promise<T>, operationName: string): Promise<T> {
   let lastError: Error | null = null;
   let backoffMs = INITIAL_BACKOFF_MS;
 
@@ -260,13 +281,13 @@ async function withRetry<T>(fn: () => Promise<T>, operationName: string): Promis
  * Upload file to LlamaParse API.
  * AC-13.1.2: File Upload with Page Marker Configuration
  *
- * @param fileBuffer - File content as ArrayBuffer
+ * @param file - File content as Blob
  * @param filename - Original filename
  * @param config - LlamaParse configuration
  * @returns Job ID on success
  */
 async function uploadFile(
-  fileBuffer: ArrayBuffer,
+  file: Blob,
   filename: string,
   config: LlamaParseConfig
 ): Promise<string> {
@@ -274,8 +295,9 @@ async function uploadFile(
   const url = `${baseUrl}/api/parsing/upload`;
 
   // Create form data with file and parsing options
+  // Append the Blob directly - re-wrapping it would copy the whole file
   const formData = new FormData();
-  formData.append('file', new Blob([fileBuffer]), filename);
+  formData.append('file', file, filename);
 
   // Constraint 3: LlamaParse upload MUST set page_prefix
   // AC-13.1.2: Configure page_prefix to match existing parser pattern
@@ -286,7 +308,7 @@ async function uploadFile(
 
   log.info('Uploading file to LlamaParse', {
     filename,
-    sizeBytes: fileBuffer.byteLength,
+    sizeBytes: file.size,
     url,
   });
 
@@ -303,7 +325,7 @@ async function uploadFile(
     throw new UploadError(`Upload failed: ${response.status} ${response.statusText}`, {
       status: response.status,
       statusText: response.statusText,
-      body: errorText,
+      body: errorText.slice(0, MAX_ERROR_BODY_LENGTH),
     });
   }
 
@@ -366,17 +388,23 @@ async function pollJobUntilComplete(
   onProgress?: (stage: string, percent: number) => Promise<void>
 ): Promise<LlamaParseJobStatus> {
   const pollingInterval = config.pollingIntervalMs || DEFAULT_POLLING_INTERVAL_MS;
+  const maxPollingInterval = config.maxPollingIntervalMs || DEFAULT_MAX_POLLING_INTERVAL_MS;
   const maxWaitTime = config.maxWaitTimeMs || DEFAULT_MAX_WAIT_TIME_MS;
   const startTime = Date.now();
 
   log.info('Starting job polling', {
     jobId,
     pollingIntervalMs: pollingInterval,
+    maxPollingIntervalMs: maxPollingInterval,
     maxWaitTimeMs: maxWaitTime,
   });
 
   let lastProgress = 0;
 
+  // AC-13.1.3: Poll frequently while jobs are young, then back off toward
+  // the ceiling - long-running jobs don't need a status round-trip every 2s
+  let currentInterval = pollingInterval;
+
   while (true) {
     const elapsed = Date.now() - startTime;
 
@@ -416,8 +444,11 @@ async function pollJobUntilComplete(
         break;
     }
 
-    // AC-13.1.3: Poll job status every 2 seconds (configurable)
-    await sleep(pollingInterval);
+    await sleep(currentInterval);
+    currentInterval = Math.min(
+      Math.round(currentInterval * POLLING_BACKOFF_FACTOR),
+      maxPollingInterval
+    );
   }
 }
 
@@ -548,7 +579,10 @@ export function extractPageMarkersWithIndices(markdown: string): PageMarker[] {
  * @returns DoclingResult for downstream processing
  */
 export function convertToDoclingResult(llamaResult: LlamaParseResult): DoclingResult {
-  const pageMarkers = extractPageMarkersWithIndices(llamaResult.markdown);
+  // Reuse the markers extracted during parsing; only re-scan if a caller
+  // built the result by hand without them
+  const pageMarkers =
+    llamaResult.pageMarkers ?? extractPageMarkersWithIndices(llamaResult.markdown);
 
   // AC-13.1.5: Handle empty pageMarkers case (treat entire document as page 1)
   // Page count priority: explicit pageCount > marker count > 1
@@ -574,23 +608,26 @@ export function convertToDoclingResult(llamaResult: LlamaParseResult): DoclingRe
  * 2. Job polling with progress updates
  * 3. Result retrieval
  *
- * @param fileBuffer - PDF file content as ArrayBuffer
+ * @param file - PDF file content as a Blob or ArrayBuffer
  * @param filename - Original filename
  * @param config - LlamaParse configuration
  * @param onProgress - Optional callback for progress updates
  * @returns LlamaParseResult with markdown and metadata
  */
 export async function parseDocumentWithLlamaParse(
-  fileBuffer: ArrayBuffer,
+  file: Blob | ArrayBuffer,
   filename: string,
   config: LlamaParseConfig,
   onProgress?: (stage: string, percent: number) => Promise<void>
 ): Promise<LlamaParseResult> {
   const startTime = Date.now();
 
+  // Normalize once up front; ArrayBuffer input is kept for backward compat
+  const fileBlob = file instanceof Blob ? file : new Blob([file]);
+
   log.info('Starting LlamaParse document parsing', {
     filename,
-    fileSizeBytes: fileBuffer.byteLength,
+    fileSizeBytes: fileBlob.size,
   });
 
   try {
@@ -601,7 +638,7 @@ export async function parseDocumentWithLlamaParse(
 
     // Step 1: Upload file (AC-13.1.2)
     const jobId = await withRetry(
-      () => uploadFile(fileBuffer, filename, config),
+      () => uploadFile(fileBlob, filename, config),
       'uploadFile'
     );
 
@@ -622,9 +659,12 @@ export async function parseDocumentWithLlamaParse(
     const processingTimeMs = Date.now() - startTime;
 
     // AC-13.1.4: Parse page count from result
+    // Markers are extracted once here and carried on the result so that
+    // downstream conversion does not have to re-scan the markdown
+    const pageMarkers = extractPageMarkersWithIndices(markdown);
+
     // Use API response num_pages if available, otherwise count from markers
-    const pageMarkersCount = extractPageMarkersWithIndices(markdown).length;
-    const pageCount = finalStatus.num_pages || pageMarkersCount || 1;
+    const pageCount = finalStatus.num_pages || pageMarkers.length || 1;
 
     log.info('LlamaParse document parsing complete', {
       jobId,
@@ -637,6 +677,7 @@ export async function parseDocumentWithLlamaParse(
     return {
       markdown,
       pageCount,
+      pageMarkers,
       jobId,
       processingTimeMs,
     };